@@ -1,5 +1,4 @@
 import numpy as np
-import tensorflow as tf
 import joblib
 import pandas as pd
 import plotly.graph_objects as go
@@ -10,7 +9,8 @@ import json
 from flask import Flask, render_template, request
 from f1_data_loader import load_race_data, load_2025_dropdown
 from helper import prepare_inputs_infer, get_driver_info
-from positional_encoding import PositionalEncoding
+from models import load_model
+from uncertainty import predict_intervals, predict_point
 
 # Load model + scaler
 x_scaler = joblib.load("static/model/X_scaler.pkl")
@@ -36,20 +36,8 @@ def predict():
     driver = request.form["driver"]
     model_choice = request.form["model_choice"]
 
-    if model_choice == "lstm":
-        model_path = "static/model/F1_laptime_model.keras"
-    elif model_choice == "bilstm":
-        model_path = "static/model/F1_laptime_model_bilstm.keras"
-    elif model_choice == "gru":
-        model_path = "static/model/F1_laptime_model_GRU.keras"
-    elif model_choice == "transformer":
-        model_path = "static/model/F1_laptime_model_transformer.keras"
-        model = tf.keras.models.load_model("static/model/F1_laptime_model_transformer.keras",
-                custom_objects={"PositionalEncoding": PositionalEncoding})
-    
-    if model_choice != "transformer":
-        model = tf.keras.models.load_model(model_path, compile=False)
-
+    uncertainty = request.form.get("uncertainty") == "on"
+    model = load_model(model_choice)
 
     df_race = load_race_data(2025, race)
     df_driver = df_race[df_race["Driver"] == driver].sort_values("LapNumber")
@@ -78,16 +66,16 @@ def predict():
     print("Xd shape:", Xd.shape)
     print("Xt shape:", Xt.shape)
 
-    # prediction
-    y_pred_scaled = model.predict(
-        {
-            "num_input": X_num,
-            "driver_input": Xd,
-            "team_input": Xt
-        }
-    ).flatten()
+    inputs = {
+        "num_input": X_num,
+        "driver_input": Xd,
+        "team_input": Xt
+    }
 
-    y_pred = y_scaler.inverse_transform(y_pred_scaled.reshape(-1, 1)).flatten()
+    # prediction (the band comes from MC samples, the line stays deterministic)
+    y_pred = predict_point(model, inputs, y_scaler)
+    if uncertainty:
+        _, y_p10, y_p90 = predict_intervals(model, inputs, y_scaler)
 
     # correct alignment: use df_clean
     y_true = df_clean.loc[indices, "lap_time"].values
@@ -98,8 +86,16 @@ def predict():
 
     # plot
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=laps_list, y=y_true_list, mode="lines", name="True"))
-    fig.add_trace(go.Scatter(x=laps_list, y=y_pred_list, mode="lines", name="Predicted"))
+    fig.add_trace(go.Scatter(x=laps_list, y=y_true_list, mode="lines", name="True",
+                             line=dict(color="#636EFA")))
+    fig.add_trace(go.Scatter(x=laps_list, y=y_pred_list, mode="lines", name="Predicted",
+                             line=dict(color="#EF553B")))
+    if uncertainty:
+        fig.add_trace(go.Scatter(x=laps_list, y=y_p90.tolist(), mode="lines",
+                                 line=dict(width=0, color="#EF553B"), showlegend=False, hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=laps_list, y=y_p10.tolist(), mode="lines",
+                                 line=dict(width=0, color="#EF553B"), fill="tonexty",
+                                 fillcolor="rgba(239, 85, 59, 0.25)", name="P10-P90"))
     graphJSON = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
     print(graphJSON[:200])
 
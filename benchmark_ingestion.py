@@ -0,0 +1,213 @@
+"""
+Offline ingestion throughput benchmark.
+
+Runs the season ingestion path (load_race_data -> process_session) against
+recorded sessions (ReplaySource) and reports races/sec, rows/sec and peak
+memory while scaling from a single race up to several synthetic seasons.
+Throughput is timed in an untraced pass; peak memory comes from a second,
+tracemalloc-traced pass.
+
+    # record fixtures once from the FastF1 cache (needs FastF1 data)
+    python benchmark_ingestion.py --record 2025
+
+    # benchmark against the recorded fixtures
+    python benchmark_ingestion.py --seasons 1 2 4
+
+If no fixtures have been recorded, raw frames are rebuilt from the processed
+CSVs in static/processed_races so the benchmark still runs fully offline.
+"""
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from f1_data_loader import (
+    CACHE_DIR_PROCESSED, REPLAY_DIR, ReplaySource,
+    list_races, load_race_data, record_session
+)
+
+SEASON_LENGTH = 24
+
+
+def frames_from_processed(df):
+    """Rebuild FastF1-shaped laps / weather_data / track_status frames from a processed CSV."""
+    df = df.sort_values(["Driver", "LapNumber"]).reset_index(drop=True)
+
+    laps = pd.DataFrame({
+        "Driver": df["Driver"],
+        "Team": df["Team"],
+        "LapNumber": df["LapNumber"],
+        "LapTime": pd.to_timedelta(df["lap_time"], unit="s"),
+        "Sector1Time": pd.to_timedelta(df["s1"], unit="s"),
+        "Sector2Time": pd.to_timedelta(df["s2"], unit="s"),
+        "Sector3Time": pd.to_timedelta(df["s3"], unit="s"),
+        "Compound": df["Compound"],
+        "TyreLife": df["TyreLife"],
+        "Stint": df["Stint"],
+    })
+    # session time at the end of each lap
+    laps["Time"] = pd.Timedelta("1h") + laps.groupby("Driver")["LapTime"].cumsum()
+    laps["PitInTime"] = laps["Time"].where(df["pit_flag"] == 1)
+    laps["PitOutTime"] = pd.NaT
+
+    weather = pd.DataFrame({
+        "Time": laps["Time"],
+        "AirTemp": df["AirTemp"],
+        "TrackTemp": df["TrackTemp"],
+        "Rainfall": df["Rainfall"].astype(bool),
+    }).sort_values("Time").iloc[::20].reset_index(drop=True)
+
+    code = np.select(
+        [df["red_flag"] == 1, df["sc_flag"] == 1, df["vsc_flag"] == 1, df["yellow_flag"] == 1],
+        ["5", "4", "6", "2"],
+        default="1"
+    )
+    status = pd.DataFrame({"Time": laps["Time"], "Status": code}).sort_values("Time")
+    status = status[status["Status"] != status["Status"].shift()].reset_index(drop=True)
+    status["Message"] = ""
+
+    return {"laps": laps, "weather_data": weather, "track_status": status}
+
+
+def write_fixture(root, year, event_name, frames):
+    path = ReplaySource(root).session_path(year, event_name)
+    os.makedirs(path, exist_ok=True)
+    for name, frame in frames.items():
+        frame.to_pickle(os.path.join(path, f"{name}.pkl"))
+
+
+def base_fixtures(fixtures_dir):
+    """Return [(year, event_name, frames)] from recorded fixtures, or from processed CSVs."""
+    source = ReplaySource(fixtures_dir)
+    out = []
+    if os.path.isdir(fixtures_dir):
+        for year in sorted(os.listdir(fixtures_dir)):
+            for race in source.list_races(year):
+                session = source.get_session(year, race)
+                session.load()
+                out.append((year, race, {
+                    "laps": session.laps,
+                    "weather_data": session.weather_data,
+                    "track_status": session.track_status,
+                }))
+    if out:
+        return out
+
+    print(f"No fixtures in {fixtures_dir}, rebuilding from {CACHE_DIR_PROCESSED}")
+    for csv in sorted(glob.glob(f"{CACHE_DIR_PROCESSED}/*.csv")):
+        df = pd.read_csv(csv)
+        if df.empty:
+            continue
+        year = os.path.basename(csv).split("_", 1)[0]
+        out.append((year, df["race"].iloc[0], frames_from_processed(df)))
+    return out
+
+
+def build_synthetic(root, base, n_races):
+    """Tile the base fixtures into n_races synthetic sessions under root."""
+    events = []
+    for i in range(n_races):
+        _, race, frames = base[i % len(base)]
+        year = 3000 + i // SEASON_LENGTH
+        event_name = f"{race} R{i % SEASON_LENGTH + 1:02d}"
+        write_fixture(root, year, event_name, frames)
+        events.append((year, event_name))
+    return events
+
+
+def _ingest_season(args):
+    """Load every race of a recorded season through load_race_data and concatenate it."""
+    year, root, cache_dir = args
+    source = ReplaySource(root)
+    races = source.list_races(year)
+    frames = [load_race_data(year, race, source=source, cache_dir=cache_dir) for race in races]
+    frames = [df for df in frames if df is not None]
+    season = pd.concat(frames, ignore_index=True) if frames else None
+    return season, len(frames)
+
+
+def run(years, root, workers=1, trace=False):
+    """
+    Ingest every season into a fresh CSV cache, keeping all season frames
+    alive until the end the way the season loaders do.
+    With trace=True peak memory is measured with tracemalloc (in-process only).
+    """
+    cache_dir = tempfile.mkdtemp(prefix="csv_", dir=root)
+    jobs = [(year, root, cache_dir) for year in years]
+
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_ingest_season, jobs))
+    else:
+        results = [_ingest_season(job) for job in jobs]
+
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    rows = sum(len(season) for season, _ in results if season is not None)
+    ok = sum(n for _, n in results)
+    return elapsed, rows, ok, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=REPLAY_DIR)
+    parser.add_argument("--record", type=int, metavar="YEAR",
+                        help="record every race of YEAR from FastF1 into --fixtures and exit")
+    parser.add_argument("--seasons", type=float, nargs="+", default=[1, 2, 4],
+                        help="synthetic season counts to benchmark (a single race is always included)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="ingest seasons with a process pool in the timing pass "
+                             "(the memory pass always runs in-process)")
+    args = parser.parse_args()
+
+    if args.record:
+        for race in list_races(args.record):
+            try:
+                print("Recorded:", record_session(args.record, race, root=args.fixtures))
+            except Exception as e:
+                print(f"FAILED RECORD {race}: {e}")
+        return
+
+    base = base_fixtures(args.fixtures)
+    if not base:
+        print("Nothing to benchmark.")
+        return
+
+    sizes = [1] + [max(1, int(s * SEASON_LENGTH)) for s in args.seasons]
+
+    print(f"{'races':>6} {'rows':>9} {'secs':>8} {'races/s':>8} {'rows/s':>10} {'peak MB':>8}")
+    for n in sizes:
+        root = tempfile.mkdtemp(prefix="f1_replay_")
+        try:
+            events = build_synthetic(root, base, n)
+            years = sorted({year for year, _ in events})
+            # time without tracing, then measure memory in a separate traced pass
+            elapsed, rows, ok, _ = run(years, root, workers=args.workers)
+            _, _, _, peak = run(years, root, trace=True)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+        if ok < n:
+            print(f"  {n - ok} of {n} sessions failed")
+        print(f"{n:>6} {rows:>9} {elapsed:>8.2f} {n / elapsed:>8.2f} "
+              f"{rows / elapsed:>10.0f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
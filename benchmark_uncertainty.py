@@ -0,0 +1,90 @@
+"""
+Cost of prediction intervals versus a single deterministic predict.
+
+For every available architecture this times, on the windows of one processed
+race:
+  - predict:     model.predict(), the existing /predict path
+  - call:        one deterministic forward pass, model(x, training=False)
+  - mc_batched:  predict_intervals(), K tiled copies in one forward pass
+  - mc_loop:     K sequential dropout-active forward passes (the naive way)
+Both MC variants include the inverse_transform and percentile reduction.
+
+    python benchmark_uncertainty.py --race static/processed_races/2025_Bahrain_Grand_Prix.csv -k 30
+"""
+import argparse
+import os
+import pickle
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from helper import prepare_inputs_infer
+from models import MODEL_PATHS, load_model
+from uncertainty import MC_SAMPLES, freeze_batchnorm, predict_intervals, reduce_samples
+
+
+def timed(fn, repeats):
+    fn()  # warm-up / tracing
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1000
+
+
+def race_inputs(csv_path, x_scaler, vocab):
+    df = pd.read_csv(csv_path)
+    df = df[
+        (df["pit_flag"] == 0) &
+        (df["yellow_flag"] == 0) &
+        (df["sc_flag"] == 0) &
+        (df["vsc_flag"] == 0)
+    ]
+    df = df[(df["lap_time"] > 40) & (df["lap_time"] < 110)].reset_index(drop=True)
+    X_num, Xd, Xt, _ = prepare_inputs_infer(df, x_scaler, vocab)
+    return {"num_input": X_num, "driver_input": Xd, "team_input": Xt}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--race", default="static/processed_races/2025_Bahrain_Grand_Prix.csv")
+    parser.add_argument("-k", "--samples", type=int, default=MC_SAMPLES)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    x_scaler = joblib.load("static/model/X_scaler.pkl")
+    y_scaler = joblib.load("static/model/y_scaler.pkl")
+    with open("static/model/id_mappings.pkl", "rb") as f:
+        vocab = pickle.load(f)
+
+    inputs = race_inputs(args.race, x_scaler, vocab)
+    k = args.samples
+    print(f"{len(inputs['num_input'])} windows, K={k}\n")
+
+    print(f"{'model':<12} {'predict ms':>11} {'call ms':>9} {'mc_batched ms':>14} "
+          f"{'mc_loop ms':>11} {'batched/call':>13}")
+    for choice, path in MODEL_PATHS.items():
+        if not os.path.exists(path):
+            print(f"{choice:<12} (no saved model at {path})")
+            continue
+        model = load_model(choice)
+        freeze_batchnorm(model)
+
+        def mc_loop():
+            y_scaled = np.concatenate([model(inputs, training=True).numpy() for _ in range(k)])
+            return reduce_samples(y_scaled, y_scaler, k)
+
+        t_predict = timed(lambda: model.predict(inputs, verbose=0), args.repeats)
+        t_call = timed(lambda: model(inputs, training=False), args.repeats)
+        t_batched = timed(lambda: predict_intervals(model, inputs, y_scaler, k), args.repeats)
+        t_loop = timed(mc_loop, args.repeats)
+
+        print(f"{choice:<12} {t_predict:>11.1f} {t_call:>9.1f} {t_batched:>14.1f} "
+              f"{t_loop:>11.1f} {t_batched / t_call:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ os.makedirs(CACHE_DIR, exist_ok=True)
 fastf1.Cache.enable_cache(CACHE_DIR)
 CACHE_DIR_PROCESSED = "static/processed_races"
 os.makedirs(CACHE_DIR_PROCESSED, exist_ok=True)
+REPLAY_DIR = "static/replay_sessions"
+REPLAY_FRAMES = ("laps", "weather_data", "track_status")
 
 
 def td_to_sec(td):
@@ -15,9 +17,77 @@ def td_to_sec(td):
     return td.total_seconds() if isinstance(td, pd.Timedelta) else None
 
 
-def process_session(year, event_name):
+class FastF1Source:
+    """Session source backed by the live FastF1 API (and its on-disk cache)."""
+
+    def get_session(self, year, event_name):
+        return fastf1.get_session(year, event_name, "R")
+
+    def list_races(self, year):
+        schedule = get_event_schedule(year)
+        return schedule["EventName"].tolist()
+
+
+class ReplaySession:
+    """Offline stand-in for a FastF1 session, loaded from recorded frames."""
+
+    def __init__(self, path):
+        self.path = path
+        self.laps = None
+        self.weather_data = None
+        self.track_status = None
+
+    def load(self):
+        for name in REPLAY_FRAMES:
+            setattr(self, name, pd.read_pickle(os.path.join(self.path, f"{name}.pkl")))
+
+
+class ReplaySource:
+    """
+    Session source that replays frames written by record_session().
+    Layout: <root>/<year>/<Event_Name>/{laps,weather_data,track_status}.pkl
+    """
+
+    def __init__(self, root=REPLAY_DIR):
+        self.root = root
+
+    def session_path(self, year, event_name):
+        return os.path.join(self.root, str(year), event_name.replace(" ", "_"))
+
+    def get_session(self, year, event_name):
+        path = self.session_path(year, event_name)
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"No recorded session at {path}")
+        return ReplaySession(path)
+
+    def list_races(self, year):
+        year_dir = os.path.join(self.root, str(year))
+        if not os.path.isdir(year_dir):
+            return []
+        return [d.replace("_", " ") for d in sorted(os.listdir(year_dir))]
+
+
+DEFAULT_SOURCE = FastF1Source()
+
+
+def record_session(year, event_name, root=REPLAY_DIR, source=None):
+    """Serialize the raw frames of a session so ReplaySource can serve them offline."""
+    source = source or DEFAULT_SOURCE
+    session = source.get_session(year, event_name)
+    session.load()
+
+    path = ReplaySource(root).session_path(year, event_name)
+    os.makedirs(path, exist_ok=True)
+    for name in REPLAY_FRAMES:
+        # plain DataFrame so the pickle does not drag FastF1 objects along
+        pd.DataFrame(getattr(session, name)).to_pickle(os.path.join(path, f"{name}.pkl"))
+    return path
+
+
+def process_session(year, event_name, source=None):
+    source = source or DEFAULT_SOURCE
     try:
-        session = fastf1.get_session(year, event_name, "R")
+        session = source.get_session(year, event_name)
         session.load()
     except Exception as e:
         print(f"FAILED SESSION {event_name}: {e}")
@@ -112,13 +182,14 @@ def process_session(year, event_name):
     return out
 
 
-def load_race_data(year, race_name):
+def load_race_data(year, race_name, source=None, cache_dir=CACHE_DIR_PROCESSED):
     """
     Loads race laps from local CSV cache if available.
-    Otherwise processes using FastF1, saves CSV, then returns dataframe.
+    Otherwise processes using the session source (FastF1 by default),
+    saves CSV, then returns dataframe.
     """
     safe_name = race_name.replace(" ", "_")
-    cache_file = f"{CACHE_DIR_PROCESSED}/{year}_{safe_name}.csv"
+    cache_file = f"{cache_dir}/{year}_{safe_name}.csv"
 
     # 1. If cached file exists → load it
     if os.path.exists(cache_file):
@@ -129,12 +200,12 @@ def load_race_data(year, race_name):
             print(f"Error loading cached CSV for {race_name}: {e}")
             # continue and regenerate
     
-    # 2. Otherwise: load via FastF1
-    print(f"Fetching from FastF1: {race_name}")
-    df = process_session(year, race_name)
+    # 2. Otherwise: load via the session source
+    print(f"Fetching session: {race_name}")
+    df = process_session(year, race_name, source=source)
 
     if df is None:
-        print(f"Failed to load race (FastF1): {race_name}")
+        print(f"Failed to load race: {race_name}")
         return None
 
     # 3. Save processed data
@@ -147,19 +218,19 @@ def load_race_data(year, race_name):
     return df
 
 
-def list_races(year=2025):
+def list_races(year=2025, source=None):
     """Return a list of official F1 race names for the season."""
-    schedule = get_event_schedule(year)
-    return schedule["EventName"].tolist()
+    source = source or DEFAULT_SOURCE
+    return source.list_races(year)
 
-def load_2025_dropdown():
+def load_2025_dropdown(source=None, cache_dir=CACHE_DIR_PROCESSED):
     year = 2025
-    all_races = list_races(year)
+    all_races = list_races(year, source=source)
     good_races = []
     drivers = set()
 
     for race in all_races:
-        df = load_race_data(year, race)
+        df = load_race_data(year, race, source=source, cache_dir=cache_dir)
         if df is None:
             print(f"Skipping race (failed): {race}")
             continue
@@ -0,0 +1,18 @@
+import tensorflow as tf
+
+from positional_encoding import PositionalEncoding
+
+MODEL_PATHS = {
+    "lstm": "static/model/F1_laptime_model.keras",
+    "bilstm": "static/model/F1_laptime_model_bilstm.keras",
+    "gru": "static/model/F1_laptime_model_GRU.keras",
+    "transformer": "static/model/F1_laptime_model_transformer.keras",
+}
+
+
+def load_model(model_choice):
+    """Load the saved keras model for a model_choice key from MODEL_PATHS."""
+    if model_choice == "transformer":
+        return tf.keras.models.load_model(MODEL_PATHS[model_choice],
+                custom_objects={"PositionalEncoding": PositionalEncoding})
+    return tf.keras.models.load_model(MODEL_PATHS[model_choice], compile=False)
@@ -0,0 +1,59 @@
+import numpy as np
+import tensorflow as tf
+
+QUANTILES = (0.1, 0.5, 0.9)
+MC_SAMPLES = 30
+
+
+def freeze_batchnorm(model):
+    """
+    Make model(x, training=True) sample dropout only. BatchNormalization with
+    trainable=False keeps using its moving stats even when training=True.
+    """
+    for layer in model.layers:
+        if isinstance(layer, tf.keras.layers.BatchNormalization):
+            layer.trainable = False
+
+
+def has_quantile_head(model):
+    """True if the model was trained with one output per entry of QUANTILES."""
+    return model.outputs[0].shape[-1] == len(QUANTILES)
+
+
+def predict_point(model, inputs, y_scaler):
+    """Deterministic per-window lap time in seconds (the median for quantile-head models)."""
+    y_scaled = model.predict(inputs)
+    if has_quantile_head(model):
+        y_scaled = y_scaled[:, QUANTILES.index(0.5)]
+    return y_scaler.inverse_transform(y_scaled.reshape(-1, 1)).flatten()
+
+
+def reduce_samples(y_scaled, y_scaler, n_samples):
+    """Inverse-transform n_samples stacked predictions and reduce to mean, P10, P90."""
+    samples = y_scaler.inverse_transform(y_scaled.reshape(-1, 1)).reshape(n_samples, -1)
+    p10, p90 = np.percentile(samples, [10, 90], axis=0)
+    return samples.mean(axis=0), p10, p90
+
+
+def predict_intervals(model, inputs, y_scaler, n_samples=MC_SAMPLES):
+    """
+    Per-window mean, P10 and P90 lap time in seconds.
+
+    Quantile-head models are served directly. Otherwise each window is tiled
+    n_samples times and run through the model in a single batched forward
+    pass with dropout active (MC dropout); the samples are reduced in NumPy
+    after y_scaler.inverse_transform.
+    """
+    n = len(inputs["num_input"])
+
+    if has_quantile_head(model):
+        q = model(inputs, training=False).numpy()
+        q = y_scaler.inverse_transform(q.reshape(-1, 1)).reshape(n, len(QUANTILES))
+        q = np.sort(q, axis=1)  # guard against crossing quantiles
+        return q[:, 1], q[:, 0], q[:, 2]
+
+    freeze_batchnorm(model)
+    tiled = {k: np.tile(v, (n_samples,) + (1,) * (v.ndim - 1)) for k, v in inputs.items()}
+
+    y_scaled = model(tiled, training=True).numpy()
+    return reduce_samples(y_scaled, y_scaler, n_samples)